@@ -1,6 +1,7 @@
 import logging
+import os
 from fractions import Fraction
-from functools import singledispatchmethod
+from functools import lru_cache, singledispatchmethod
 from math import ceil, floor
 from copy import deepcopy
 
@@ -15,9 +16,24 @@ from dftt_timecode.pattern import *
 #                     datefmt='%Y-%m-%d %a %H:%M:%S',
 #                     level=logging.DEBUG)
 #set up logger
+_LEVEL_MAP = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
+# 环境变量DFTT_LOG_LEVEL仅在导入时解析一次，未设置或取值非法时使用默认的DEBUG级别
+_ENV_LEVEL = _LEVEL_MAP.get(os.environ.get('DFTT_LOG_LEVEL', '').upper())
+_LEVEL = _ENV_LEVEL if _ENV_LEVEL is not None else logging.DEBUG
 logger=logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-formatter=logging.Formatter('%(asctime)s [%(levelname)s] [%(filename)s:%(lineno)d-%(funcName)s()] %(message)s')
+logger.setLevel(_LEVEL)
+# 仅在DEBUG级别下使用带时间与调用位置的详细格式，其余级别使用开销更小的格式（不格式化asctime）
+# 格式字符串为固定常量，使用{}风格并关闭validate，省去构造时的格式校验
+if _LEVEL <= logging.DEBUG:
+    formatter=logging.Formatter('{asctime} [{levelname}] [{filename}:{lineno}-{funcName}()] {message}', style='{', validate=False)
+else:
+    formatter=logging.Formatter('[{levelname}] {name}: {message}', style='{', validate=False)
 
 stream_handler=logging.StreamHandler()
 stream_handler.setFormatter(formatter)
@@ -126,7 +142,7 @@ class DfttTimecode:
         temp_timecode_list = [
             int(x) if x else 0 for x in SRT_REGEX.match(timecode_value).groups()]
         # 由于SRT格式本身不存在帧率，将为SRT赋予默认帧率和丢帧状态
-        logger.info(f'SRT timecode framerate {self.__fps}, DF={self.__drop_frame} assigned')
+        logger.info('SRT timecode framerate %s, DF=%s assigned', self.__fps, self.__drop_frame)
         hh,mm,ss,sub_sec = temp_timecode_list
         
         self.__precise_time = Fraction(hh * 3600 + mm * 60 + ss + sub_sec / 1000)
@@ -144,7 +160,7 @@ class DfttTimecode:
         temp_timecode_list = [
             int(x) if x else 0 for x in DLP_REGEX.match(timecode_value).groups()]
         # 由于DLP不存在帧率，将为DLP赋予默认帧率和丢帧状态
-        logger.info(f'DLP timecode framerate {self.__fps}, DF={self.__drop_frame} assigned')
+        logger.info('DLP timecode framerate %s, DF=%s assigned', self.__fps, self.__drop_frame)
         hh, mm, ss, sub_sec = temp_timecode_list
         # dlp每秒共250个子帧 即4ms一个
         # 详见https://interop-docs.cinepedia.com/Reference_Documents/CineCanvas(tm)_RevC.pdf 第17页 “TimeIn”部分
@@ -206,48 +222,52 @@ class DfttTimecode:
     def __init_common(self, timecode_type,fps,drop_frame,strict):
         self.__type = timecode_type
         self.__fps = fps
+        # 读入帧率取整为名义帧率便于后续计算（包括判断时码是否合法，DF/NDF逻辑等) 用进一法是因为要判断ff值是否大于fps-1
         self.__nominal_fps = ceil(fps)
         self.__drop_frame = self.__validate_drop_frame(drop_frame, fps)
         self.__strict = strict
         
+    @staticmethod
+    @lru_cache(maxsize=4096, typed=True)
+    def __parse_string(timecode_value: str, timecode_type: TimecodeType, fps, drop_frame: bool, strict: bool):
+        # 字符串解析，返回(时码类型, 精准时间戳)；typed=True使24与Fraction(24)等帧率分开缓存，解析失败时抛出的异常不会被缓存
+        minus_flag = timecode_value.startswith('-')
+        temp_object = object.__new__(DfttTimecode)
+        temp_object.__init_common(timecode_type, fps, drop_frame, strict)  # drop_frame已由构造函数校验，再次校验结果不变
+
+        timecode_type = timecode_type if timecode_type != 'auto' else temp_object.__detect_timecode_type(timecode_value)
+
+        timecode_type_handler_map={
+            'smpte':temp_object.__init_smpte,
+            'srt':temp_object.__init_srt,
+            'dlp':temp_object.__init_dlp,
+            'ffmpeg':temp_object.__init_ffmpeg,
+            'fcpx':temp_object.__init_fcpx,
+            'frame':temp_object.__init_frame,
+            'time':temp_object.__init_time
+        }
+        init_func=timecode_type_handler_map[timecode_type]
+        init_func(timecode_value,minus_flag)
+        return timecode_type, temp_object.__precise_time
+
+    def __log_instance(self, timecode_value) -> None:
+        if logger.isEnabledFor(logging.DEBUG):  # 每次实例化都会执行，未启用DEBUG时跳过日志参数的构造
+            logger.debug('value type %s Timecode instance: type=%s, fps=%s, dropframe=%s, strict=%s',
+                         type(timecode_value), self.__type, self.__fps, self.__drop_frame, self.__strict, stacklevel=2)
+
     @singledispatchmethod
     def __init__(self, timecode_value, timecode_type, fps, drop_frame, strict):  # 构造函数
         raise TypeError(f"Unsupported timecode value type: {type(timecode_value)}")
 
     @__init__.register  # 若传入的TC值为字符串，则调用此函数
     def _(self, timecode_value: str, timecode_type:TimecodeType='auto', fps=24.0, drop_frame=None, strict=True):
-        # if timecode_value[0] == '-':  # 判断首位是否为负，并为flag赋值
-        #     minus_flag = True
-        # else:
-        #     minus_flag = False
-        minus_flag= timecode_value.startswith('-')
-        self.__fps = fps
-        # 读入帧率取整为名义帧率便于后续计算（包括判断时码是否合法，DF/NDF逻辑等) 用进一法是因为要判断ff值是否大于fps-1
-        self.__nominal_fps = ceil(fps)
-        self.__drop_frame = self.__validate_drop_frame(drop_frame, fps)
-        self.__strict = strict
-        
-        timecode_type= timecode_type if timecode_type != 'auto' else self.__detect_timecode_type(timecode_value)
-        
-        self.__type = timecode_type      
-    
-        timecode_type_handler_map={
-            'smpte':self.__init_smpte,
-            'srt':self.__init_srt,
-            'dlp':self.__init_dlp,
-            'ffmpeg':self.__init_ffmpeg,
-            'fcpx':self.__init_fcpx,
-            'frame':self.__init_frame,
-            'time':self.__init_time
-        }
-        init_func=timecode_type_handler_map[timecode_type]
-        if not init_func:
-            raise DFTTTimecodeTypeError(f'Unknown timecode type :{timecode_type}')
-        init_func(timecode_value,minus_flag)
-    
-        instance_success_log = f'value type {type(timecode_value)} Timecode instance: type={self.__type}, fps={self.__fps}, dropframe={self.__drop_frame}, strict={self.__strict}'
-        # logging.debug(instance_success_log)
-        logger.debug(instance_success_log)
+        self.__init_common(timecode_type, fps, drop_frame, strict)
+
+        # 解析结果只取决于输入字符串与帧率/丢帧/严格模式，重复出现的时码字符串直接复用缓存结果
+        self.__type, self.__precise_time = self.__parse_string(
+            timecode_value, timecode_type, self.__fps, self.__drop_frame, self.__strict)
+
+        self.__log_instance(timecode_value)
 
     @__init__.register  # 输入为Fraction类分数，此时认为输入是时间戳，若不是，则会报错
     def _(self, timecode_value: Fraction, timecode_type='time', fps=24.0, drop_frame=False, strict=True):
@@ -259,8 +279,7 @@ class DfttTimecode:
             logger.error(
                 f'Timecode type [{timecode_type}] DONOT match input value [{timecode_value}]! Check input.')
             raise DFTTTimecodeTypeError
-        instance_success_log = f'value type {type(timecode_value)} Timecode instance: type={self.__type}, fps={self.__fps}, dropframe={self.__drop_frame}, strict={self.__strict}'
-        logger.debug(instance_success_log)
+        self.__log_instance(timecode_value)
 
     @__init__.register
     def _(self, timecode_value: int, timecode_type='frame', fps=24.0, drop_frame=False, strict=True):
@@ -281,8 +300,7 @@ class DfttTimecode:
             logger.error(
                 f'Timecode type [{timecode_type}] DONOT match input value [{timecode_value}]! Check input.')
             raise DFTTTimecodeTypeError
-        instance_success_log = f'value type {type(timecode_value)} Timecode instance: type={self.__type}, fps={self.__fps}, dropframe={self.__drop_frame}, strict={self.__strict}'
-        logger.debug(instance_success_log)
+        self.__log_instance(timecode_value)
 
     @__init__.register
     def _(self, timecode_value: float, timecode_type='time', fps=24.0, drop_frame=False, strict=True):
@@ -294,8 +312,7 @@ class DfttTimecode:
             logger.error(
                 f'Timecode type [{timecode_type}] DONOT match input value [{timecode_value}]! Check input.')
             raise DFTTTimecodeTypeError
-        instance_success_log = f'value type {type(timecode_value)} Timecode instance: type={self.__type}, fps={self.__fps}, dropframe={self.__drop_frame}, strict={self.__strict}'
-        logger.debug(instance_success_log)
+        self.__log_instance(timecode_value)
 
     @__init__.register
     def _(self, timecode_value: tuple, timecode_type='time', fps=24.0, drop_frame=False, strict=True):
@@ -308,8 +325,7 @@ class DfttTimecode:
             logger.error(
                 f'Timecode type [{timecode_type}] DONOT match input value [{timecode_value}]! Check input.')
             raise DFTTTimecodeTypeError
-        instance_success_log = f'value type {type(timecode_value)} Timecode instance: type={self.__type}, fps={self.__fps}, dropframe={self.__drop_frame}, strict={self.__strict}'
-        logger.debug(instance_success_log)
+        self.__log_instance(timecode_value)
 
     @__init__.register
     def _(self, timecode_value: list, timecode_type='time', fps=24.0, drop_frame=False, strict=True):
@@ -322,8 +338,7 @@ class DfttTimecode:
             logger.error(
                 f'Timecode type [{timecode_type}] DONOT match input value [{timecode_value}]! Check input.')
             raise DFTTTimecodeTypeError
-        instance_success_log = f'value type {type(timecode_value)} Timecode instance: type={self.__type}, fps={self.__fps}, dropframe={self.__drop_frame}, strict={self.__strict}'
-        logger.debug(instance_success_log)
+        self.__log_instance(timecode_value)
 
     @property
     def type(self) -> str:
@@ -1,11 +1,15 @@
+import re
 import setuptools
-import dftt_timecode as package
+
+# 直接从源码文本读取包名与版本号，避免在打包时导入dftt_timecode（及其日志初始化等副作用）
+with open("dftt_timecode/__init__.py", "r", encoding='UTF-8') as fh:
+    package_info = dict(re.findall(r"^(name|__version__) = '([^']*)'", fh.read(), re.M))
 with open("README.md", "r",encoding='UTF-8') as fh:
     long_description = fh.read()
 
 setuptools.setup(
-    name=package.name,
-    version=package.__version__,
+    name=package_info['name'],
+    version=package_info['__version__'],
     author="You Ziyuan",
     author_email="hikaridragon0216@gmail.com",
     description="Timecode library for film and TV industry, supports HFR and a bunch of cool features",
@@ -0,0 +1,13 @@
+from functools import lru_cache
+
+import pytest
+from dftt_timecode import DfttTimecode as TC
+
+
+@pytest.fixture(scope="session")
+def tc_cache():
+    @lru_cache(maxsize=None, typed=True)
+    def _tc(timecode_value, timecode_type, fps, drop_frame, strict):
+        return TC(timecode_value, timecode_type, fps, drop_frame, strict)
+
+    return _tc
@@ -1,25 +1,64 @@
+from copy import copy
+import logging
+import math
 from fractions import Fraction
 import pytest
-from dftt_timecode.error import *
+from dftt_timecode.error import DFTTTimecodeOperatorError, DFTTTimecodeValueError
 from dftt_timecode import DfttTimecode as TC
 
+_P24 = ("auto", 24, False, True)
+_P2997DF = ("auto", 29.97, True, True)
+_P11988DF = ("auto", 119.88, True, True)
+_P60000_1001 = ("auto", Fraction(60000, 1001), True, True)
+
+_IDS_5 = ("smpte", "frame", "time", "smpte_df", "srt")
+_IDS_3 = ("smpte", "frame", "time")
+_IDS_NF = ("smpte", "frame", "time", "smpte_nf")
+_IDS_CAST = ("smpte", "smpte_df", "frame", "time", "srt")
+_IDS_NUM_OP = (
+    "smpte_int",
+    "frame_int",
+    "time_int",
+    "smpte_df_int",
+    "srt_int",
+    "smpte_float",
+    "frame_float",
+    "time_float",
+    "srt_float",
+)
+_IDS_NUM_OP_NO_TIME_INT = (
+    "smpte_int",
+    "frame_int",
+    "smpte_df_int",
+    "srt_int",
+    "smpte_float",
+    "frame_float",
+    "time_float",
+    "srt_float",
+)
+
 
 @pytest.fixture(
     params=[
-        ("00:00:01:00", "auto", 24, False, True),
-        ("1000", "auto", 119.88, True, True),
-        ("1.0", "auto", Fraction(60000, 1001), True, True),
-        ("00:01:00;02", "auto", 29.97, True, True),
-        ("01:00:00,123", "auto", 24, False, True),
+        ("00:00:01:00", *_P24, "23:59:59:00"),
+        ("1000", *_P11988DF, "10356632"),
+        ("1.0", *_P60000_1001, "86399.0"),
+        ("00:01:00;02", *_P2997DF, "23:58:59;28"),
+        ("01:00:00,123", *_P24, "22:59:59,877"),
     ],
-    ids=["smpte", "frame", "time", "smpte_df", "srt"],
+    ids=_IDS_5,
 )
 def tc_data(request):
     return request.param
 
 
-def test_tc_instance(tc_data):
-    assert isinstance(TC(*tc_data), TC)
+@pytest.fixture
+def tc_instance(tc_data, tc_cache):
+    return tc_cache(*tc_data[:-1])
+
+
+def test_tc_instance(tc_instance):
+    assert isinstance(tc_instance, TC)
 
 
 @pytest.mark.parametrize(
@@ -29,7 +68,7 @@ def test_tc_instance(tc_data):
         ("1000f", "frame", 119.88, True, True, "frame"),
         ("3600.0s", "time", Fraction(60000, 1001), True, True, "time"),
     ],
-    ids=["smpte", "frame", "time"],
+    ids=_IDS_3,
 )
 def test_type(timecode_value, timecode_type, fps, drop_frame, strict, result_type):
     assert (
@@ -40,11 +79,11 @@ def test_type(timecode_value, timecode_type, fps, drop_frame, strict, result_typ
 @pytest.mark.parametrize(
     "timecode_value, timecode_type, fps, drop_frame, strict, result_type",
     [
-        ("01:00:00:00", "auto", 24, False, True, "smpte"),
-        ("1000f", "auto", 119.88, True, True, "frame"),
-        ("3600.0s", "auto", Fraction(60000, 1001), True, True, "time"),
+        ("01:00:00:00", *_P24, "smpte"),
+        ("1000f", *_P11988DF, "frame"),
+        ("3600.0s", *_P60000_1001, "time"),
     ],
-    ids=["smpte", "frame", "time"],
+    ids=_IDS_3,
 )
 def test_auto_type(timecode_value, timecode_type, fps, drop_frame, strict, result_type):
     assert TC(timecode_value, "auto", fps, drop_frame, strict).type == result_type
@@ -58,8 +97,6 @@ def test_auto_type(timecode_value, timecode_type, fps, drop_frame, strict, resul
     ids=["smpte"],
 )
 def test_invalid_timecode(timecode_value, timecode_type, fps, drop_frame, strict):
-    from dftt_timecode.error import DFTTTimecodeValueError
-
     with pytest.raises(DFTTTimecodeValueError):
         tc = TC(timecode_value, timecode_type, fps, drop_frame, strict)
 
@@ -67,11 +104,11 @@ def test_invalid_timecode(timecode_value, timecode_type, fps, drop_frame, strict
 @pytest.mark.parametrize(
     "timecode_value, timecode_type, fps, drop_frame, strict, result_fps",
     [
-        ("01:00:00:00", "auto", 24, False, True, 24),
-        ("1000f", "auto", 119.88, True, True, 119.88),
-        ("3600.0s", "auto", Fraction(60000, 1001), True, True, Fraction(60000, 1001)),
+        ("01:00:00:00", *_P24, 24),
+        ("1000f", *_P11988DF, 119.88),
+        ("3600.0s", *_P60000_1001, Fraction(60000, 1001)),
     ],
-    ids=["smpte", "frame", "time"],
+    ids=_IDS_3,
 )
 def test_fps(timecode_value, timecode_type, fps, drop_frame, strict, result_fps):
     assert TC(timecode_value, timecode_type, fps, drop_frame, strict).fps == result_fps
@@ -80,12 +117,12 @@ def test_fps(timecode_value, timecode_type, fps, drop_frame, strict, result_fps)
 @pytest.mark.parametrize(
     "timecode_value, timecode_type, fps, drop_frame, strict, result_framecount",
     [
-        ("00:00:01:00", "auto", 24, False, True, 24),
-        ("1000f", "auto", 119.88, True, True, 1000),
-        ("1.0s", "auto", Fraction(60000, 1001), True, True, 60),
-        ("00:01:00;02", "auto", 29.97, True, True, 1800),
+        ("00:00:01:00", *_P24, 24),
+        ("1000f", *_P11988DF, 1000),
+        ("1.0s", *_P60000_1001, 60),
+        ("00:01:00;02", *_P2997DF, 1800),
     ],
-    ids=["smpte", "frame", "time", "smpte_nf"],
+    ids=_IDS_NF,
 )
 def test_framecount(
     timecode_value, timecode_type, fps, drop_frame, strict, result_framecount
@@ -99,43 +136,83 @@ def test_framecount(
 @pytest.mark.parametrize(
     "timecode_value, timecode_type, fps, drop_frame, strict",
     [
-        ("00:00:01:00", "auto", 24, False, True),
-        ("1000f", "auto", 119.88, True, True),
-        ("1.0s", "auto", Fraction(60000, 1001), True, True),
-        ("00:01:00;02", "auto", 29.97, True, True),
+        ("00:00:01:00", *_P24),
+        ("1000f", *_P11988DF),
+        ("1.0s", *_P60000_1001),
+        ("00:01:00;02", *_P2997DF),
         pytest.param("00:01:00:02", "auto", 29.97, False, True),
     ],
     ids=["smpte", "frame", "time", "smpte_df", "smpte_ndf"],
 )
 def test_dropframe_strict(timecode_value, timecode_type, fps, drop_frame, strict):
-    assert (
-        TC(timecode_value, timecode_type, fps, drop_frame, strict).is_drop_frame
-        is drop_frame
-    )
-    assert (
-        TC(timecode_value, timecode_type, fps, drop_frame, strict).is_strict is strict
-    )
+    tc = TC(timecode_value, timecode_type, fps, drop_frame, strict)
+    assert tc.is_drop_frame is drop_frame
+    assert tc.is_strict is strict
+
+
+def _minute_start_frame(minutes, nominal_fps, drop_frame):
+    if not drop_frame:
+        return minutes * nominal_fps * 60
+    drop = nominal_fps // 30 * 2
+    tens, rest = divmod(minutes, 10)
+    frame = tens * (nominal_fps * 600 - drop * 9)
+    if rest:
+        frame += nominal_fps * 60 + (rest - 1) * (nominal_fps * 60 - drop)
+    return frame
+
+
+@pytest.mark.parametrize(
+    argnames="fps,drop_frame",
+    argvalues=[(24, False), (29.97, True), (30, False), (59.94, True)],
+    ids=["24_NDF", "2997_DF", "30_NDF", "5994_DF"],
+)
+def test_frame_smpte_roundtrip(fps, drop_frame, caplog):
+    caplog.set_level(logging.WARNING, logger="dftt_timecode.core.dftt_timecode")
+    day_frames = round(fps * 86400)
+    nominal_fps = math.ceil(fps)
+    frames = set(range(0, day_frames, 10007))
+    for minutes in (1, 2, 9, 10, 11, 59, 60, 599, 600, 601, 1439):
+        start = _minute_start_frame(minutes, nominal_fps, drop_frame)
+        frames.update((start - 1, start))
+    frames.add(day_frames - 1)
+    for frame in sorted(frames):
+        smpte = TC(frame, "frame", fps, drop_frame, True).timecode_output("smpte")
+        back = TC(smpte, "smpte", fps, drop_frame, True)
+        assert int(back.timecode_output("frame")) == frame, smpte
 
 
 @pytest.fixture(
     params=[
-        ("00:01:01:01", "auto", 24, False, True, 61.04167, Fraction(1465 / 24)),
-        ("1000f", "auto", 119.88, True, True, 8.34168, Fraction(1000 / 119.88)),
+        ("00:01:01:01", *_P24, 61.04167, Fraction(1465 / 24)),
+        ("1000f", *_P11988DF, 8.34168, Fraction(1000 / 119.88)),
         ("1.0s", "auto", Fraction(60000 / 1001), True, True, 1, 1),
-        ("00:01:00;02", "auto", 29.97, True, True, 60.06006, Fraction(1800 / 29.97)),
+        ("00:01:00;02", *_P2997DF, 60.06006, Fraction(1800 / 29.97)),
     ],
-    ids=["smpte", "frame", "time", "smpte_nf"],
+    ids=_IDS_NF,
 )
 def timestamp_data(request):
     return request.param
 
 
-def test_timestamp(timestamp_data):
-    assert TC(*timestamp_data[:-2]).timestamp == pytest.approx(timestamp_data[-2])
+def test_timestamp(timestamp_data, tc_cache):
+    assert abs(tc_cache(*timestamp_data[:-2]).timestamp - timestamp_data[-2]) < 1e-4
+
+
+def test_precise_timestamp(timestamp_data, tc_cache):
+    assert tc_cache(*timestamp_data[:-2]).precise_timestamp == timestamp_data[-1]
+
 
+def test_parse_cache_keeps_fps_type():
+    int_fps = TC("00:00:00:01", "smpte", 24, False, True)
+    fraction_fps = TC("00:00:00:01", "smpte", Fraction(24), False, True)
+    assert int_fps.precise_timestamp == Fraction(1 / 24)
+    assert fraction_fps.precise_timestamp == Fraction(1, 24)
 
-def test_precise_timestamp(timestamp_data):
-    assert TC(*timestamp_data[:-2]).precise_timestamp == timestamp_data[-1]
+
+def test_parse_cache_does_not_cache_errors():
+    for _ in range(2):
+        with pytest.raises(DFTTTimecodeValueError):
+            TC("00:00:00:30", "smpte", 24, False, True)
 
 
 @pytest.fixture(
@@ -149,8 +226,8 @@ def set_fps_data(request):
     yield request.param
 
 
-def test_set_fps(set_fps_data):
-    tc = TC(*set_fps_data[:-3])
+def test_set_fps(set_fps_data, tc_cache):
+    tc = copy(tc_cache(*set_fps_data[:-3]))
     tc.set_fps(set_fps_data[-3], rounding=set_fps_data[-2])
     assert tc.fps == set_fps_data[-3]
     tc.set_fps(set_fps_data[2])
@@ -168,8 +245,8 @@ def set_type_data(request):
     yield request.param
 
 
-def test_set_type(set_type_data):
-    tc = TC(*set_type_data[:-3])
+def test_set_type(set_type_data, tc_cache):
+    tc = copy(tc_cache(*set_type_data[:-3]))
     tc.set_type(set_type_data[-3], rounding=set_type_data[-2])
     assert tc.type == set_type_data[-3]
     assert tc.timecode_output(set_type_data[-3]) == set_type_data[-1]
@@ -186,8 +263,8 @@ def set_strict_data(request):
     yield request.param
 
 
-def test_set_strict(set_strict_data):
-    tc = TC(*set_strict_data[:-2])
+def test_set_strict(set_strict_data, tc_cache):
+    tc = copy(tc_cache(*set_strict_data[:-2]))
     assert tc.is_strict == set_strict_data[-3]
     tc.set_strict()
     assert tc.is_strict == set_strict_data[-2]
@@ -199,10 +276,7 @@ def test_set_strict(set_strict_data):
     argvalues=[
         (
             "00:00:01:00",
-            "auto",
-            24,
-            False,
-            True,
+            *_P24,
             "00:00:01:00",
             "24",
             "1.0",
@@ -212,10 +286,7 @@ def test_set_strict(set_strict_data):
         ),
         (
             "00:10:00;00",
-            "auto",
-            29.97,
-            True,
-            True,
+            *_P2997DF,
             "00:10:00;00",
             "17982",
             "600.0",
@@ -254,10 +325,7 @@ def test_timecode_output(
     argvalues=[
         (
             "11:22:33:13",
-            "auto",
-            24,
-            False,
-            True,
+            *_P24,
             "smpte",
             "11:22:33:13",
             "11",
@@ -267,10 +335,7 @@ def test_timecode_output(
         ),
         (
             "11:22:33,456",
-            "auto",
-            24,
-            False,
-            True,
+            *_P24,
             "srt",
             "11:22:33,456",
             "11",
@@ -302,179 +367,202 @@ def test_timecode_output_part(
     assert tc.timecode_output(output_type, output_part=4) == part_4
 
 
-def test_print(tc_data, capsys):
-    tc = TC(*tc_data)
-    print(tc, end="")
+def test_print(tc_data, tc_instance, capsys):
+    print(tc_instance, end="")
     print_output = capsys.readouterr()
     assert print_output.out == tc_data[0]
 
 
-@pytest.fixture()
-def neg_result(request):
-    neg_result_data = {
-        "00:00:01:00": "23:59:59:00",
-        "1000": "10356632",
-        "1.0": "86399.0",
-        "00:01:00;02": "23:58:59;28",
-        "01:00:00,123": "22:59:59,877",
-    }
-    tc_value = request.node.funcargs["tc_data"][0]
-    print(tc_value)
-    return neg_result_data.get(tc_value)
+def test_copy(tc_instance):
+    tc_copy = copy(tc_instance)
+    assert tc_copy is not tc_instance
+    assert tc_copy == tc_instance
+    assert tc_copy.type == tc_instance.type
+    assert tc_copy.is_drop_frame is tc_instance.is_drop_frame
+    tc_copy.set_strict(not tc_instance.is_strict)
+    assert tc_copy.is_strict is not tc_instance.is_strict
 
 
-def test_neg(tc_data, neg_result):
-    tc = TC(*tc_data)
-    tc = -tc
+def test_neg(tc_data, tc_instance):
+    neg_result = tc_data[-1]
+    tc = -tc_instance
     assert tc.timecode_output() == neg_result
 
 
+def _build_operands(tc_cache, params, clone=False):
+    operands = []
+    for param in params:
+        if isinstance(param, tuple):
+            param = tc_cache(*param)
+            if clone:
+                param = copy(param)
+        operands.append(param)
+    return tuple(operands)
+
+
+def _check_sum(data):
+    tc_sum = data[0] + data[1]
+    assert tc_sum == data[2]
+
+
+def _check_difference(data):
+    tc_diff = data[0] - data[1]
+    assert tc_diff == data[2]
+
+
 @pytest.fixture(
     params=[
         (
-            ("00:00:01:00", "auto", 24, False, True),
+            ("00:00:01:00", *_P24),
             ("23:59:59:00", "auto", 24, False, False),
-            ("00:00:00:00", "auto", 24, False, True),
+            ("00:00:00:00", *_P24),
         ),
         (
-            ("1000", "auto", 119.88, True, True),
-            ("120", "auto", 119.88, True, True),
-            ("1120", "auto", 119.88, True, True),
-        ),
-        pytest.param(
-            (
-                ("1000", "auto", 119.88, True, True),
-                ("1s", "auto", 119.88, True, True),
-                ("1120", "auto", 119.88, True, True),
-            ),
-            marks=pytest.mark.xfail,
+            ("1000", *_P11988DF),
+            ("120", *_P11988DF),
+            ("1120", *_P11988DF),
         ),
         (
-            ("1s", "auto", Fraction(60000, 1001), True, True),
-            ("1.0", "auto", Fraction(60000, 1001), True, True),
-            ("2s", "auto", Fraction(60000, 1001), True, True),
+            ("1s", *_P60000_1001),
+            ("1.0", *_P60000_1001),
+            ("2s", *_P60000_1001),
         ),
         (
-            ("00:00:59;29", "auto", 29.97, True, True),
-            ("00:00:00;01", "auto", 29.97, True, True),
-            ("00:01:00;02", "auto", 29.97, True, True),
+            ("00:00:59;29", *_P2997DF),
+            ("00:00:00;01", *_P2997DF),
+            ("00:01:00;02", *_P2997DF),
         ),
         (
-            ("01:00:00,123", "auto", 24, False, True),
-            ("01:00:00,878", "auto", 24, False, True),
-            ("02:00:01,001", "auto", 24, False, True),
+            ("01:00:00,123", *_P24),
+            ("01:00:00,878", *_P24),
+            ("02:00:01,001", *_P24),
         ),
     ],
-    ids=["smpte", "frame", "frame_xfail", "time", "smpte_df", "srt"],
+    ids=_IDS_5,
 )
-def plus_tc_data(request):
-    return [TC(*request.param[i]) for i in range(3)]
+def plus_tc_data(request, tc_cache):
+    return _build_operands(tc_cache, request.param, clone=True)
 
 
 def test_plus_tc(plus_tc_data):
-    tc_plus = plus_tc_data[0] + plus_tc_data[1]
-    assert tc_plus == plus_tc_data[2]
+    _check_sum(plus_tc_data)
 
 
 @pytest.fixture(
     params=[
         (
-            ("00:00:00:23", "auto", 24, False, True),
+            ("1000", *_P11988DF),
+            ("1s", *_P11988DF),
+            ("1120", *_P11988DF),
+        ),
+    ],
+    ids=["frame"],
+)
+def plus_tc_xfail_data(request, tc_cache):
+    return _build_operands(tc_cache, request.param, clone=True)
+
+
+@pytest.mark.xfail
+def test_plus_tc_xfail(plus_tc_xfail_data):
+    _check_sum(plus_tc_xfail_data)
+
+
+@pytest.fixture(
+    params=[
+        (
+            ("00:00:00:23", *_P24),
             1,
-            ("00:00:01:00", "auto", 24, False, True),
+            ("00:00:01:00", *_P24),
         ),
         (
-            ("1000", "auto", 119.88, True, True),
+            ("1000", *_P11988DF),
             111,
-            ("1111", "auto", 119.88, True, True),
-        ),
-        pytest.param(
-            (
-                ("1s", "auto", Fraction(60000, 1001), True, True),
-                60,
-                ("2s", "auto", Fraction(60000, 1001), True, True),
-            ),
-            marks=pytest.mark.xfail,
+            ("1111", *_P11988DF),
         ),
         (
-            ("00:00:59;29", "auto", 29.97, True, True),
+            ("00:00:59;29", *_P2997DF),
             1,
-            ("00:01:00;02", "auto", 29.97, True, True),
+            ("00:01:00;02", *_P2997DF),
         ),
         (
-            ("01:00:00,123", "auto", 24, False, True),
+            ("01:00:00,123", *_P24),
             24,
-            ("01:00:01,123", "auto", 24, False, True),
+            ("01:00:01,123", *_P24),
         ),
         (
-            ("00:00:00:23", "auto", 24, False, True),
+            ("00:00:00:23", *_P24),
             1.0,
-            ("00:00:01:23", "auto", 24, False, True),
-        ),
-        pytest.param(
-            (
-                ("1000", "auto", 119.88, True, True),
-                1.0,
-                ("1120", "auto", 119.88, True, True),
-            ),
-            marks=pytest.mark.xfail,
+            ("00:00:01:23", *_P24),
         ),
         (
-            ("1s", "auto", Fraction(60000, 1001), True, True),
+            ("1s", *_P60000_1001),
             60.0,
-            ("61s", "auto", Fraction(60000, 1001), True, True),
-        ),
-        pytest.param(
-            (
-                ("00:00:59;29", "auto", 29.97, True, True),
-                1.0,
-                ("00:01:01;01", "auto", 29.97, True, True),
-            ),
-            marks=pytest.mark.xfail,
+            ("61s", *_P60000_1001),
         ),
         (
-            ("01:00:00,123", "auto", 24, False, True),
+            ("01:00:00,123", *_P24),
             0.877,
-            ("01:00:01,000", "auto", 24, False, True),
-        ),
-        pytest.param(
-            (
-                ("00:09:59;00", "auto", 29.97, True, True),
-                Fraction(1000, 1001),
-                ("00:10:00;00", "auto", 29.97, True, True),
-            ),
-            marks=pytest.mark.xfail,
+            ("01:00:01,000", *_P24),
         ),
     ],
     ids=[
         "smpte_int",
         "frame_int",
-        "time_int_xfail",
         "smpte_df_int",
         "srt_int",
         "smpte_float",
-        "frame_float_xfail",
         "time_float",
-        "smpte_df_float",
         "srt_float",
-        "smpte_df_fraction_xfail",
     ],
 )
-def plus_num_data(request):
-    return [TC(*request.param[0]), request.param[1], TC(*request.param[2])]
+def plus_num_data(request, tc_cache):
+    return _build_operands(tc_cache, request.param)
 
 
 def test_plus_num(plus_num_data):
-    tc_plus = plus_num_data[0] + plus_num_data[1]
-    assert tc_plus == plus_num_data[2]
+    _check_sum(plus_num_data)
+
+
+@pytest.fixture(
+    params=[
+        (
+            ("1s", *_P60000_1001),
+            60,
+            ("2s", *_P60000_1001),
+        ),
+        (
+            ("1000", *_P11988DF),
+            1.0,
+            ("1120", *_P11988DF),
+        ),
+        (
+            ("00:00:59;29", *_P2997DF),
+            1.0,
+            ("00:01:01;01", *_P2997DF),
+        ),
+        (
+            ("00:09:59;00", *_P2997DF),
+            Fraction(1000, 1001),
+            ("00:10:00;00", *_P2997DF),
+        ),
+    ],
+    ids=["time_int", "frame_float", "smpte_df_float", "smpte_df_fraction"],
+)
+def plus_num_xfail_data(request, tc_cache):
+    return _build_operands(tc_cache, request.param)
+
+
+@pytest.mark.xfail
+def test_plus_num_xfail(plus_num_xfail_data):
+    _check_sum(plus_num_xfail_data)
 
 
 @pytest.fixture(
     params=[
         (
-            ("00:00:01:00", "auto", 24, False, True),
+            ("00:00:01:00", *_P24),
             ("00:00:02:00", "auto", 24, False, False),
-            ("23:59:59:00", "auto", 24, False, True),
+            ("23:59:59:00", *_P24),
         ),
         (
             ("1000", "auto", 119.88, True, False),
@@ -482,175 +570,170 @@ def test_plus_num(plus_num_data):
             ("-1", "auto", 119.88, True, False),
         ),
         (
-            ("2s", "auto", Fraction(60000, 1001), True, True),
-            ("1.0", "auto", Fraction(60000, 1001), True, True),
-            ("1s", "auto", Fraction(60000, 1001), True, True),
+            ("2s", *_P60000_1001),
+            ("1.0", *_P60000_1001),
+            ("1s", *_P60000_1001),
         ),
         (
-            ("00:00:59;29", "auto", 29.97, True, True),
-            ("1", "auto", 29.97, True, True),
-            ("00:00:59;28", "auto", 29.97, True, True),
+            ("00:00:59;29", *_P2997DF),
+            ("1", *_P2997DF),
+            ("00:00:59;28", *_P2997DF),
         ),
         (
-            ("00:00:00,100", "auto", 24, False, True),
-            ("00:00:01,000", "auto", 24, False, True),
-            ("23:59:59,100", "auto", 24, False, True),
+            ("00:00:00,100", *_P24),
+            ("00:00:01,000", *_P24),
+            ("23:59:59,100", *_P24),
         ),
     ],
-    ids=["smpte", "frame", "time", "smpte_df", "srt"],
+    ids=_IDS_5,
 )
-def sub_tc_data(request):
-    return [TC(*request.param[i]) for i in range(3)]
+def sub_tc_data(request, tc_cache):
+    return _build_operands(tc_cache, request.param, clone=True)
 
 
 def test_sub_tc(sub_tc_data):
-    tc_sub = sub_tc_data[0] - sub_tc_data[1]
-    assert tc_sub == sub_tc_data[2]
+    _check_difference(sub_tc_data)
 
 
 @pytest.fixture(
     params=[
         (
-            ("00:00:00:23", "auto", 24, False, True),
+            ("00:00:00:23", *_P24),
             23,
-            ("00:00:00:00", "auto", 24, False, True),
+            ("00:00:00:00", *_P24),
         ),
         (
             ("1000", "auto", 119.88, True, False),
             1001,
             ("-1", "auto", 119.88, True, False),
         ),
-        pytest.param(
-            (
-                ("1s", "auto", Fraction(60000, 1001), True, True),
-                60,
-                ("0s", "auto", Fraction(60000, 1001), True, True),
-            ),
-            marks=pytest.mark.xfail,
-        ),
         (
-            ("00:00:59;29", "auto", 29.97, True, True),
+            ("00:00:59;29", *_P2997DF),
             1,
-            ("00:00:59;28", "auto", 29.97, True, True),
+            ("00:00:59;28", *_P2997DF),
         ),
         (
-            ("01:00:00,123", "auto", 24, False, True),
+            ("01:00:00,123", *_P24),
             24,
-            ("00:59:59,123", "auto", 24, False, True),
+            ("00:59:59,123", *_P24),
         ),
         (
-            ("00:00:00:23", "auto", 24, False, True),
+            ("00:00:00:23", *_P24),
             1.0,
-            ("23:59:59:23", "auto", 24, False, True),
+            ("23:59:59:23", *_P24),
         ),
         (("1000", "auto", 120, True, True), 1.0, ("880", "auto", 120, True, True)),
         (("1s", "auto", 60, True, True), 60.0, ("86341s", "auto", 60, True, True)),
-        pytest.param(
-            (
-                ("00:01:01;02", "auto", 29.97, True, True),
-                1.0,
-                ("00:01:00;00", "auto", 29.97, True, True),
-            ),
-            marks=pytest.mark.xfail,
-        ),
         (
-            ("01:00:00,123", "auto", 24, False, True),
+            ("01:00:00,123", *_P24),
             -0.123,
-            ("01:00:00,246", "auto", 24, False, True),
+            ("01:00:00,246", *_P24),
         ),
     ],
-    ids=[
-        "smpte_int",
-        "frame_int",
-        "time_int_xfail",
-        "smpte_df_int",
-        "srt_int",
-        "smpte_float",
-        "frame_float_xfail",
-        "time_float",
-        "smpte_df_float_xfail",
-        "srt_float",
-    ],
+    ids=_IDS_NUM_OP_NO_TIME_INT,
 )
-def sub_num_data(request):
-    return [TC(*request.param[0]), request.param[1], TC(*request.param[2])]
+def sub_num_data(request, tc_cache):
+    return _build_operands(tc_cache, request.param)
 
 
 def test_sub_num(sub_num_data):
-    tc_sub = sub_num_data[0] - sub_num_data[1]
-    assert tc_sub == sub_num_data[2]
+    _check_difference(sub_num_data)
+
+
+@pytest.fixture(
+    params=[
+        (
+            ("1s", *_P60000_1001),
+            60,
+            ("0s", *_P60000_1001),
+        ),
+        (
+            ("00:01:01;02", *_P2997DF),
+            1.0,
+            ("00:01:00;00", *_P2997DF),
+        ),
+    ],
+    ids=["time_int", "smpte_df_float"],
+)
+def sub_num_xfail_data(request, tc_cache):
+    return _build_operands(tc_cache, request.param)
+
+
+@pytest.mark.xfail
+def test_sub_num_xfail(sub_num_xfail_data):
+    _check_difference(sub_num_xfail_data)
 
 
 @pytest.fixture(
     params=[
         (
             23,
-            ("00:00:00:23", "auto", 24, False, True),
-            ("00:00:00:00", "auto", 24, False, True),
+            ("00:00:00:23", *_P24),
+            ("00:00:00:00", *_P24),
         ),
         (
             1001,
             ("1002", "auto", 119.88, True, False),
             ("-1", "auto", 119.88, True, False),
         ),
-        pytest.param(
-            (
-                60,
-                ("1s", "auto", Fraction(60000, 1001), True, True),
-                ("0s", "auto", Fraction(60000, 1001), True, True),
-            ),
-            marks=pytest.mark.xfail,
-        ),
         (
             1800,
-            ("00:00:59;29", "auto", 29.97, True, True),
-            ("00:00:00;01", "auto", 29.97, True, True),
+            ("00:00:59;29", *_P2997DF),
+            ("00:00:00;01", *_P2997DF),
         ),
         (
             24,
-            ("00:00:00,123", "auto", 24, False, True),
-            ("00:00:00,877", "auto", 24, False, True),
+            ("00:00:00,123", *_P24),
+            ("00:00:00,877", *_P24),
         ),
         (
             1.0,
-            ("00:00:00:23", "auto", 24, False, True),
-            ("00:00:00:01", "auto", 24, False, True),
+            ("00:00:00:23", *_P24),
+            ("00:00:00:01", *_P24),
         ),
         (10.0, ("1000", "auto", 120, True, True), ("200", "auto", 120, True, True)),
         (1.0, ("60s", "auto", 60, True, True), ("86341s", "auto", 60, True, True)),
         (
             0.123,
-            ("01:00:00,123", "auto", 24, False, True),
-            ("23:00:00,000", "auto", 24, False, True),
+            ("01:00:00,123", *_P24),
+            ("23:00:00,000", *_P24),
         ),
     ],
-    ids=[
-        "smpte_int",
-        "frame_int",
-        "time_int_xfail",
-        "smpte_df_int",
-        "srt_int",
-        "smpte_float",
-        "frame_float_xfail",
-        "time_float",
-        "srt_float",
-    ],
+    ids=_IDS_NUM_OP_NO_TIME_INT,
 )
-def rsub_num_data(request):
-    return [request.param[0], TC(*request.param[1]), TC(*request.param[2])]
+def rsub_num_data(request, tc_cache):
+    return _build_operands(tc_cache, request.param)
 
 
 def test_rsub_num(rsub_num_data):
-    tc_sub = rsub_num_data[0] - rsub_num_data[1]
-    assert tc_sub == rsub_num_data[2]
+    _check_difference(rsub_num_data)
+
+
+@pytest.fixture(
+    params=[
+        (
+            60,
+            ("1s", *_P60000_1001),
+            ("0s", *_P60000_1001),
+        ),
+    ],
+    ids=["time_int"],
+)
+def rsub_num_xfail_data(request, tc_cache):
+    return _build_operands(tc_cache, request.param)
+
+
+@pytest.mark.xfail
+def test_rsub_num_xfail(rsub_num_xfail_data):
+    _check_difference(rsub_num_xfail_data)
 
 
 @pytest.fixture(
     params=[
         (
-            ("00:00:00:23", "auto", 24, False, True),
+            ("00:00:00:23", *_P24),
             2,
-            ("00:00:01:22", "auto", 24, False, True),
+            ("00:00:01:22", *_P24),
         ),
         (
             ("1002", "auto", 119.88, True, False),
@@ -658,47 +741,37 @@ def test_rsub_num(rsub_num_data):
             ("2004", "auto", 119.88, True, False),
         ),
         (
-            ("1s", "auto", Fraction(60000, 1001), True, True),
+            ("1s", *_P60000_1001),
             60,
-            ("60s", "auto", Fraction(60000, 1001), True, True),
+            ("60s", *_P60000_1001),
         ),
         (
-            ("00:01:00;02", "auto", 29.97, True, True),
+            ("00:01:00;02", *_P2997DF),
             10,
-            ("00:10:00;18", "auto", 29.97, True, True),
+            ("00:10:00;18", *_P2997DF),
         ),
         (
-            ("00:00:00,123", "auto", 24, False, True),
+            ("00:00:00,123", *_P24),
             10,
-            ("00:00:01,230", "auto", 24, False, True),
+            ("00:00:01,230", *_P24),
         ),
         (
-            ("00:00:00:00", "auto", 24, False, True),
+            ("00:00:00:00", *_P24),
             10000.11,
-            ("00:00:00:00", "auto", 24, False, True),
+            ("00:00:00:00", *_P24),
         ),
         (("1000", "auto", 120, True, True), 1.5, ("1500", "auto", 120, True, True)),
         (("60s", "auto", 60, True, True), 1.5, ("90s", "auto", 60, True, True)),
         (
-            ("01:00:00,000", "auto", 24, False, True),
+            ("01:00:00,000", *_P24),
             1.5,
-            ("01:30:00,000", "auto", 24, False, True),
+            ("01:30:00,000", *_P24),
         ),
     ],
-    ids=[
-        "smpte_int",
-        "frame_int",
-        "time_int",
-        "smpte_df_int",
-        "srt_int",
-        "smpte_float",
-        "frame_float",
-        "time_float",
-        "srt_float",
-    ],
+    ids=_IDS_NUM_OP,
 )
-def mul_num_data(request):
-    return [TC(*request.param[0]), request.param[1], TC(*request.param[2])]
+def mul_num_data(request, tc_cache):
+    return _build_operands(tc_cache, request.param)
 
 
 def test_mul(mul_num_data):
@@ -709,10 +782,8 @@ def test_mul(mul_num_data):
 
 
 def test_mul_xfail():
-    from dftt_timecode.error import DFTTTimecodeOperatorError
-
-    tc_1 = TC("00:00:00:23", "auto", 24, False, True)
-    tc_2 = TC("00:11:45:14", "auto", 24, False, True)
+    tc_1 = TC("00:00:00:23", *_P24)
+    tc_2 = TC("00:11:45:14", *_P24)
     with pytest.raises(DFTTTimecodeOperatorError):
         tc_mul_xfail = tc_1 * tc_2
 
@@ -720,9 +791,9 @@ def test_mul_xfail():
 @pytest.fixture(
     params=[
         (
-            ("00:00:01:00", "auto", 24, False, True),
+            ("00:00:01:00", *_P24),
             2,
-            ("00:00:00:12", "auto", 24, False, True),
+            ("00:00:00:12", *_P24),
         ),
         (
             ("114514", "auto", 119.88, True, False),
@@ -730,53 +801,42 @@ def test_mul_xfail():
             ("57257", "auto", 119.88, True, False),
         ),
         (
-            ("60s", "auto", Fraction(60000, 1001), True, True),
+            ("60s", *_P60000_1001),
             60,
-            ("1s", "auto", Fraction(60000, 1001), True, True),
+            ("1s", *_P60000_1001),
         ),
         (
-            ("00:01:00;02", "auto", 29.97, True, True),
+            ("00:01:00;02", *_P2997DF),
             0.1,
-            ("00:10:00;18", "auto", 29.97, True, True),
+            ("00:10:00;18", *_P2997DF),
         ),
         (
-            ("00:00:01,234", "auto", 24, False, True),
+            ("00:00:01,234", *_P24),
             Fraction(1, 2),
-            ("00:00:02,468", "auto", 24, False, True),
+            ("00:00:02,468", *_P24),
         ),
         (
-            ("00:00:00:00", "auto", 24, False, True),
+            ("00:00:00:00", *_P24),
             10000.11,
-            ("00:00:00:00", "auto", 24, False, True),
+            ("00:00:00:00", *_P24),
         ),
         (("1000", "auto", 120, True, True), 2.5, ("400", "auto", 120, True, True)),
         (("60s", "auto", 60, True, True), 1.5, ("40s", "auto", 60, True, True)),
         (
-            ("01:00:00,000", "auto", 24, False, True),
+            ("01:00:00,000", *_P24),
             0.5,
-            ("02:00:00,000", "auto", 24, False, True),
+            ("02:00:00,000", *_P24),
         ),
     ],
-    ids=[
-        "smpte_int",
-        "frame_int",
-        "time_int",
-        "smpte_df_int",
-        "srt_int",
-        "smpte_float",
-        "frame_float",
-        "time_float",
-        "srt_float",
-    ],
+    ids=_IDS_NUM_OP,
 )
-def div_num_data(request):
-    return [TC(*request.param[0]), request.param[1], TC(*request.param[2])]
+def div_num_data(request, tc_cache):
+    return _build_operands(tc_cache, request.param)
 
 
 def test_div(div_num_data):
     tc_div = div_num_data[0] / div_num_data[1]
     assert tc_div == div_num_data[2]
-    from dftt_timecode.error import DFTTTimecodeOperatorError
 
     with pytest.raises(DFTTTimecodeOperatorError):
         div_num_data[1] / div_num_data[0]
@@ -786,14 +846,14 @@ def test_div(div_num_data):
     argnames="tc_value,compare_tc_value",
     argvalues=[
         pytest.param(
-            ("00:00:01:00", "auto", 24, False, True),
+            ("00:00:01:00", *_P24),
             ("00:00:01:00", "auto", 25, False, True),
             marks=pytest.mark.xfail(raises=DFTTTimecodeOperatorError),
         ),
-        (("00:00:01:00", "auto", 24, False, True), ("24", "auto", 24, False, True)),
+        (("00:00:01:00", *_P24), ("24", *_P24)),
         (
-            ("00:10:00;00", "auto", 29.97, True, True),
-            ("600.0", "auto", 29.97, True, True),
+            ("00:10:00;00", *_P2997DF),
+            ("600.0", *_P2997DF),
         ),
         (
             ("00:00:01:60", "auto", 120, False, True),
@@ -802,20 +862,20 @@ def test_div(div_num_data):
     ],
     ids=["smpte_smpte_xfail", "smpte_frame", "smpte_time", "smpte_srt"],
 )
-def test_eq_tc(tc_value, compare_tc_value):
-    assert TC(*tc_value) == TC(*compare_tc_value)
+def test_eq_tc(tc_value, compare_tc_value, tc_cache):
+    assert tc_cache(*tc_value) == tc_cache(*compare_tc_value)
 
 
 @pytest.mark.parametrize(
     argnames="tc_value,compare_num",
     argvalues=[
-        (("00:00:01:00", "auto", 24, False, True), 24),
-        (("114514", "auto", 24, False, True), 114514),
-        pytest.param(("60s", "auto", 29.97, True, True), 1799, marks=pytest.mark.xfail),
+        (("00:00:01:00", *_P24), 24),
+        (("114514", *_P24), 114514),
+        pytest.param(("60s", *_P2997DF), 1799, marks=pytest.mark.xfail),
         (("00:00:01,500", "auto", 120, False, True), 180),
-        (("00:00:01:00", "auto", 24, False, True), 1.0),
-        (("2400", "auto", 24, False, True), 100.0),
-        (("60s", "auto", 29.97, True, True), 60.0),
+        (("00:00:01:00", *_P24), 1.0),
+        (("2400", *_P24), 100.0),
+        (("60s", *_P2997DF), 60.0),
         (("00:00:01,500", "auto", 120, False, True), 1.5),
     ],
     ids=[
@@ -829,222 +889,99 @@ def test_eq_tc(tc_value, compare_tc_value):
         "srt_float",
     ],
 )
-def test_eq_num(tc_value, compare_num):
-    assert TC(*tc_value) == compare_num
+def test_eq_num(tc_value, compare_num, tc_cache):
+    assert tc_cache(*tc_value) == compare_num
 
 
 @pytest.mark.parametrize(
-    argnames="tc_value,compare_value,xvalue",
+    argnames="tc_value,compare_value,expected_lt,expected_le,expected_gt,expected_ge",
     argvalues=[
         (
-            ("00:00:01:00", "auto", 24, False, True),
-            ("00:00:00:22", "auto", 24, False, True),
+            ("00:00:01:00", *_P24),
+            ("00:00:00:22", *_P24),
+            False,
+            False,
             True,
-        ),
-        (
-            ("00:00:01:00", "auto", 24, False, True),
-            ("15", "auto", 24, False, True),
             True,
         ),
         (
-            ("00:00:01:00", "auto", 24, False, True),
-            ("1.0", "auto", 24, False, True),
+            ("00:00:01:00", *_P24),
+            ("15", *_P24),
+            False,
             False,
-        ),
-        (
-            ("00:00:01:00", "auto", 24, False, True),
-            ("00:00:00,500", "auto", 24, False, True),
-            True,
-        ),
-        (("00:00:01:00", "auto", 24, False, True), 22, True),
-        (("1919", "auto", 24, False, True), 114514, False),
-        (("2s", "auto", 24, False, True), 24, True),
-        (("00:00:01,500", "auto", 24, False, True), 24, True),
-        (("00:00:01:00", "auto", 24, False, True), 0.5, True),
-        (("24", "auto", 24, False, True), 24, False),
-        (("5s", "auto", 24, False, True), 0.0, True),
-        (("00:00:01,233", "auto", 24, False, True), 1.0, True),
-    ],
-    ids=[
-        "smpte_smpte",
-        "smpte_frame",
-        "smpte_time",
-        "smpte_srt",
-        "smpte_int",
-        "frame_int",
-        "time_int",
-        "srt_int",
-        "smpte_float",
-        "frame_float",
-        "time_float",
-        "srt_float",
-    ],
-)
-def test_gt(tc_value, compare_value, xvalue):
-    tc = TC(*tc_value)
-    from numbers import Number
-
-    if isinstance(compare_value, Number):
-        assert (tc > compare_value) == xvalue
-    elif isinstance(compare_value, tuple):
-        compare_tc = TC(*compare_value)
-        assert (tc > compare_tc) == xvalue
-
-
-@pytest.mark.parametrize(
-    argnames="tc_value,compare_value,xvalue",
-    argvalues=[
-        (
-            ("00:00:01:00", "auto", 24, False, True),
-            ("00:00:00:22", "auto", 24, False, True),
             True,
-        ),
-        (
-            ("00:00:01:00", "auto", 24, False, True),
-            ("15", "auto", 24, False, True),
             True,
         ),
         (
-            ("00:00:01:00", "auto", 24, False, True),
-            ("1.0", "auto", 24, False, True),
+            ("00:00:01:00", *_P24),
+            ("1.0", *_P24),
+            False,
             True,
-        ),
-        (
-            ("00:00:01:00", "auto", 24, False, True),
-            ("00:00:00,500", "auto", 24, False, True),
+            False,
             True,
         ),
-        (("00:00:01:00", "auto", 24, False, True), 22, True),
-        (("1919", "auto", 24, False, True), 114514, False),
-        (("2s", "auto", 24, False, True), 24, True),
-        (("00:00:01,500", "auto", 24, False, True), 24, True),
-        (("00:00:01:00", "auto", 24, False, True), 0.5, True),
-        (("24", "auto", 24, False, True), 24, True),
-        (("5s", "auto", 24, False, True), 0.0, True),
-        (("00:00:01,233", "auto", 24, False, True), 1.0, True),
-    ],
-    ids=[
-        "smpte_smpte",
-        "smpte_frame",
-        "smpte_time",
-        "smpte_srt",
-        "smpte_int",
-        "frame_int",
-        "time_int",
-        "srt_int",
-        "smpte_float",
-        "frame_float",
-        "time_float",
-        "srt_float",
-    ],
-)
-def test_ge(tc_value, compare_value, xvalue):
-    tc = TC(*tc_value)
-    from numbers import Number
-
-    if isinstance(compare_value, Number):
-        assert (tc >= compare_value) == xvalue
-    elif isinstance(compare_value, tuple):
-        compare_tc = TC(*compare_value)
-        assert (tc >= compare_tc) == xvalue
-
-
-@pytest.mark.parametrize(
-    argnames="tc_value,compare_value,xvalue",
-    argvalues=[
-        (
-            ("00:00:01:00", "auto", 24, False, True),
-            ("00:00:00:22", "auto", 24, False, True),
+        pytest.param(
+            ("00:00:01:00", *_P24),
+            ("1.0", "auto", 25, False, True),
             False,
-        ),
-        (
-            ("00:00:01:00", "auto", 24, False, True),
-            ("15", "auto", 24, False, True),
+            True,
             False,
+            True,
+            marks=pytest.mark.xfail(raises=DFTTTimecodeOperatorError),
         ),
         (
-            ("00:00:01:00", "auto", 24, False, True),
-            ("1.0", "auto", 24, False, True),
+            ("00:00:01:00", *_P24),
+            ("00:00:00,500", *_P24),
             False,
-        ),
-        (
-            ("00:00:01:00", "auto", 24, False, True),
-            ("00:00:00,500", "auto", 24, False, True),
             False,
+            True,
+            True,
         ),
-        (("00:00:01:00", "auto", 24, False, True), 22, False),
-        (("1919", "auto", 24, False, True), 114514, True),
-        (("2s", "auto", 24, False, True), 999, True),
-        (("00:00:01,500", "auto", 24, False, True), 48, True),
-        (("00:00:01:00", "auto", 24, False, True), 2.0, True),
-        (("24", "auto", 24, False, True), 1.0, False),
-        (("0.0", "auto", 24, False, True), 5.0, True),
-        (("00:00:01,233", "auto", 24, False, True), 2.0, True),
     ],
     ids=[
         "smpte_smpte",
         "smpte_frame",
         "smpte_time",
+        "smpte_time_fps_xfail",
         "smpte_srt",
-        "smpte_int",
-        "frame_int",
-        "time_int",
-        "srt_int",
-        "smpte_float",
-        "frame_float",
-        "time_float",
-        "srt_float",
     ],
 )
-def test_lt(tc_value, compare_value, xvalue):
-    tc = TC(*tc_value)
-    from numbers import Number
-
-    if isinstance(compare_value, Number):
-        assert (tc < compare_value) == xvalue
-    elif isinstance(compare_value, tuple):
-        compare_tc = TC(*compare_value)
-        assert (tc < compare_tc) == xvalue
+def test_cmp_tc(
+    tc_value,
+    compare_value,
+    expected_lt,
+    expected_le,
+    expected_gt,
+    expected_ge,
+    tc_cache,
+):
+    tc = tc_cache(*tc_value)
+    compare_tc = tc_cache(*compare_value)
+    assert (tc < compare_tc) == expected_lt
+    assert (tc <= compare_tc) == expected_le
+    assert (tc > compare_tc) == expected_gt
+    assert (tc >= compare_tc) == expected_ge
 
 
 @pytest.mark.parametrize(
-    argnames="tc_value,compare_value,xvalue",
+    argnames="tc_value,compare_num,expected_lt,expected_le,expected_gt,expected_ge",
     argvalues=[
-        (
-            ("00:00:01:00", "auto", 24, False, True),
-            ("00:00:00:22", "auto", 24, False, True),
-            False,
-        ),
-        (
-            ("00:00:01:00", "auto", 24, False, True),
-            ("15", "auto", 24, False, True),
-            False,
-        ),
-        pytest.param(
-            ("00:00:01:00", "auto", 24, False, True),
-            ("1.0", "auto", 25, False, True),
-            True,
-            marks=pytest.mark.xfail(raises=DFTTTimecodeOperatorError),
-        ),
-        (
-            ("00:00:01:00", "auto", 24, False, True),
-            ("00:00:00,500", "auto", 24, False, True),
-            False,
-        ),
-        (("00:00:01:00", "auto", 24, False, True), 22, False),
-        (("1919", "auto", 24, False, True), 114514, True),
-        (("2s", "auto", 24, False, True), 999, True),
-        (("00:00:01,500", "auto", 24, False, True), 48, True),
-        (("00:00:01:00", "auto", 24, False, True), 2.0, True),
-        (("24", "auto", 24, False, True), 1.0, True),
-        (("0.0", "auto", 24, False, True), 5.0, True),
-        (("00:00:01,233", "auto", 24, False, True), 2.0, True),
+        (("00:00:01:00", *_P24), 22, False, False, True, True),
+        (("1919", *_P24), 114514, True, True, False, False),
+        (("2s", *_P24), 24, False, False, True, True),
+        (("00:00:01,500", *_P24), 24, False, False, True, True),
+        (("00:00:01:00", *_P24), 0.5, False, False, True, True),
+        (("24", *_P24), 24, False, True, False, True),
+        (("5s", *_P24), 0.0, False, False, True, True),
+        (("00:00:01,233", *_P24), 1.0, False, False, True, True),
+        (("2s", *_P24), 999, True, True, False, False),
+        (("00:00:01,500", *_P24), 48, True, True, False, False),
+        (("00:00:01:00", *_P24), 2.0, True, True, False, False),
+        (("24", *_P24), 1.0, False, True, False, True),
+        (("0.0", *_P24), 5.0, True, True, False, False),
+        (("00:00:01,233", *_P24), 2.0, True, True, False, False),
     ],
     ids=[
-        "smpte_smpte",
-        "smpte_frame",
-        "smpte_time",
-        "smpte_srt",
         "smpte_int",
         "frame_int",
         "time_int",
@@ -1053,60 +990,71 @@ def test_lt(tc_value, compare_value, xvalue):
         "frame_float",
         "time_float",
         "srt_float",
+        "time_int_larger",
+        "srt_int_larger",
+        "smpte_float_larger",
+        "frame_float_equal",
+        "time_float_larger",
+        "srt_float_larger",
     ],
 )
-def test_lt(tc_value, compare_value, xvalue):
-    tc = TC(*tc_value)
-    from numbers import Number
-
-    if isinstance(compare_value, Number):
-        assert (tc <= compare_value) == xvalue
-    elif isinstance(compare_value, tuple):
-        compare_tc = TC(*compare_value)
-        assert (tc <= compare_tc) == xvalue
+def test_cmp_num(
+    tc_value,
+    compare_num,
+    expected_lt,
+    expected_le,
+    expected_gt,
+    expected_ge,
+    tc_cache,
+):
+    tc = tc_cache(*tc_value)
+    assert (tc < compare_num) == expected_lt
+    assert (tc <= compare_num) == expected_le
+    assert (tc > compare_num) == expected_gt
+    assert (tc >= compare_num) == expected_ge
 
 
 @pytest.mark.parametrize(
     argnames="tc_value,xvalue",
     argvalues=[
-        (("00:00:01:00", "auto", 24, False, True), 1.0),
-        (("00:01:00;02", "auto", 29.97, True, True), float(Fraction(1800 / 29.97))),
-        (("48", "auto", 24, False, True), 2.0),
-        (("114514s", "auto", 24, False, True), 114514.0),
-        (("00:00:01,500", "auto", 24, False, True), 1.5),
+        (("00:00:01:00", *_P24), 1.0),
+        (("00:01:00;02", *_P2997DF), float(Fraction(1800 / 29.97))),
+        (("48", *_P24), 2.0),
+        (("114514s", *_P24), 28114.0),
+        (("00:00:01,500", *_P24), 1.5),
     ],
-    ids=["smpte", "smpte_df", "frame", "time", "srt"],
+    ids=_IDS_CAST,
 )
-def test_float(tc_value, xvalue):
-    tc = TC(*tc_value)
-    assert float(tc) == pytest.approx(xvalue, 5)
+def test_float(tc_value, xvalue, tc_cache):
+    tc = tc_cache(*tc_value)
+    assert math.isclose(float(tc), xvalue, rel_tol=1e-5)
 
 
 @pytest.mark.parametrize(
     argnames="tc_value,xvalue",
     argvalues=[
-        (("00:00:01:00", "auto", 24, False, True), 24),
-        (("00:01:00;02", "auto", 29.97, True, True), 1800),
-        (("114514", "auto", 24, False, True), 114514),
-        (("2.0s", "auto", 24, False, True), 48),
-        (("00:00:01,500", "auto", 24, False, True), 36),
+        (("00:00:01:00", *_P24), 24),
+        (("00:01:00;02", *_P2997DF), 1800),
+        (("114514", *_P24), 114514),
+        (("2.0s", *_P24), 48),
+        (("00:00:01,500", *_P24), 36),
     ],
-    ids=["smpte", "smpte_df", "frame", "time", "srt"],
+    ids=_IDS_CAST,
 )
-def test_int(tc_value, xvalue):
-    tc = TC(*tc_value)
+def test_int(tc_value, xvalue, tc_cache):
+    tc = tc_cache(*tc_value)
     assert int(tc) == xvalue
 
 
 @pytest.mark.parametrize(
     argnames="tc_value,sample_rate,xvalue",
     argvalues=[
-        (("00:00:01:00", "auto", 24, False, True), 48000, 48000),
-        (("00:00:01:01", "auto", 24, False, True), 48000, 50000),
-        (("00:00:01:01", "auto", 24, False, True), 44100, 45937),
+        (("00:00:01:00", *_P24), 48000, 48000),
+        (("00:00:01:01", *_P24), 48000, 50000),
+        (("00:00:01:01", *_P24), 44100, 45937),
     ],
     ids=["ideal", "single_frame", "24fps_44100"],
 )
-def test_audio_sample_count(tc_value, sample_rate, xvalue):
-    tc = TC(*tc_value)
+def test_audio_sample_count(tc_value, sample_rate, xvalue, tc_cache):
+    tc = tc_cache(*tc_value)
     assert tc.get_audio_sample_count(sample_rate) == xvalue
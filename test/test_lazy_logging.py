@@ -0,0 +1,28 @@
+import ast
+from pathlib import Path
+
+import dftt_timecode
+
+PACKAGE_DIR = Path(dftt_timecode.__file__).parent
+
+
+def _eager_log_calls(path):
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr in ("debug", "info")
+            and node.args
+            and isinstance(node.args[0], ast.JoinedStr)
+        ):
+            yield node.lineno
+
+
+def test_no_fstring_debug_info_logging():
+    offenders = [
+        f"{path.relative_to(PACKAGE_DIR)}:{lineno}"
+        for path in sorted(PACKAGE_DIR.rglob("*.py"))
+        for lineno in _eager_log_calls(path)
+    ]
+    assert not offenders, offenders
@@ -0,0 +1,48 @@
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _run_with_log_level(log_level, code):
+    env = {k: v for k, v in os.environ.items() if k != "DFTT_LOG_LEVEL"}
+    if log_level is not None:
+        env["DFTT_LOG_LEVEL"] = log_level
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+@pytest.mark.parametrize(
+    argnames="log_level,expected_level",
+    argvalues=[
+        ("warning", logging.WARNING),
+        ("bogus", logging.DEBUG),
+        (None, logging.DEBUG),
+    ],
+    ids=["warning", "invalid", "unset"],
+)
+def test_log_level_from_env(log_level, expected_level):
+    result = _run_with_log_level(
+        log_level,
+        "from dftt_timecode.core.dftt_timecode import logger; print(logger.level)",
+    )
+    assert int(result.stdout) == expected_level
+
+
+def test_compact_formatter_outside_debug():
+    result = _run_with_log_level(
+        "WARNING",
+        "from dftt_timecode.core.dftt_timecode import logger; logger.error('boom')",
+    )
+    assert result.stderr == "[ERROR] dftt_timecode.core.dftt_timecode: boom\n"